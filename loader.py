@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -11,11 +12,12 @@ def load_project(uploaded_file):
             "č. zakázky:": "",
         }])
     else:  # uploaded_file.name.endswith("xlsx")
-        blueprints_df = pd.read_excel(uploaded_file, sheet_name="Data z výkresu")
-        manual_df = pd.read_excel(uploaded_file, sheet_name="Data doplněná")
-        try:
-            header_df = pd.read_excel(uploaded_file, sheet_name="Hlavička")
-        except:
+        # parse the workbook once for all the sheets
+        with pd.ExcelFile(uploaded_file) as xl:
+            blueprints_df = xl.parse("Data z výkresu")
+            manual_df = xl.parse("Data doplněná")
+            header_df = xl.parse("Hlavička") if "Hlavička" in xl.sheet_names else None
+        if header_df is None:
             header_df = pd.DataFrame([{
                 "zakázka:": "",
                 "stavba:": "",
@@ -43,7 +45,12 @@ def normalize_df(blueprints_df, manual_df):
         'Součet': 'quantity',
         '--': 'unit',
     }
-    drop_columns = [c for c in df.columns if c not in column_names]
-    df = df.drop(columns=drop_columns).rename(columns=column_names)
-    df['insulation_mm'] = df['insulation_mm'].fillna(df.pop('insulation_manual_mm')).fillna(0)
+    df = df.drop(columns=df.columns.difference(column_names)).rename(columns=column_names)
+    # few distinct names, compared against every element class
+    df['name'] = df['name'].astype("category")
+    insulation = df['insulation_mm'].to_numpy(dtype=float)
+    insulation_manual = df.pop('insulation_manual_mm').to_numpy(dtype=float)
+    df['insulation_mm'] = np.where(
+        np.isnan(insulation), np.where(np.isnan(insulation_manual), 0.0, insulation_manual), insulation,
+    )
     return df
\ No newline at end of file
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -5,6 +6,28 @@ from loader import load_project, normalize_df
 from elements import ElementFactory, Pricelist
 from summarizer import Summarizer
 
+# Streamlit reruns the whole script on every widget change, keep the parsed project across reruns.
+load_project = st.cache_data(load_project)
+normalize_df = st.cache_data(normalize_df)
+
+
+@st.cache_data
+def create_elements_df(df: pd.DataFrame) -> pd.DataFrame:
+    pricelist = Pricelist()
+    elements_df = pd.DataFrame(ElementFactory.create_columns(df, pricelist))
+
+    # total insulated area per thickness, there are only a few distinct thicknesses
+    insulation_mm, inverse = np.unique(elements_df['insulation_mm'].to_numpy(), return_inverse=True)
+    area_m2 = np.bincount(inverse, weights=np.nan_to_num(elements_df['insulation_area_m2'].to_numpy()))
+    insulated = insulation_mm > 0
+    insulation_df = pd.DataFrame({"spec": insulation_mm[insulated], "quantity": area_m2[insulated]})
+    insulation_df['spec'] = "tl=" + insulation_df['spec'].astype("int64").astype(str)
+    insulation_df[["system", "name", "unit", "position", "issues"]] = ["doplňkový a izolační materiál", "Izolace", "m2", "i", ""]
+
+    # same columns on both sides let the concat stack the blocks directly
+    return pd.concat([elements_df, insulation_df.reindex(columns=elements_df.columns)])
+
+
 # Show app title and description.
 st.set_page_config(page_title="Passive Tools", page_icon="🛠️", layout="wide")
 st.title("🛠️ Passive Tools")
@@ -26,19 +49,7 @@ if uploaded_file is not None:
     
     st.success("Načteno")
 
-    df = normalize_df(blueprints_df, manual_df)
-
-    pricelist = Pricelist()
-    elements = df.apply(lambda row: ElementFactory.create_element(row, pricelist), axis=1).tolist()
-
-    elements_df = pd.DataFrame([e.to_dict() for e in elements])
-
-    insulation_df = elements_df.groupby('insulation_mm')['insulation_area_m2'].sum().rename("quantity").to_frame().reset_index(names="spec")
-    insulation_df.drop(labels=0, inplace=True)
-    insulation_df['spec'] = insulation_df['spec'].apply(lambda x: f"tl={int(x)}")
-    insulation_df[["system", "name", "unit", "position", "issues"]] = ["doplňkový a izolační materiál", "Izolace", "m2", "i", ""]
-
-    elements_df = pd.concat([elements_df, insulation_df])
+    elements_df = create_elements_df(df)
 
     s = Summarizer(header)
     s.write_inputs(blueprints_df, "Data z výkresu")
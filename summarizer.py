@@ -3,11 +3,16 @@ import datetime as dt
 import io
 import re
 
+import numpy as np
 import pandas as pd
+import xlsxwriter
+
+
+_NAT_RE = re.compile(r'(\d+)')
 
 
 def natural_keys(text):
-    return tuple((int(c) if c.isdigit() else c) for c in re.split(r'(\d+)', text))
+    return tuple((int(c) if c.isdigit() else c) for c in _NAT_RE.split(text))
 
 
 class Summarizer:
@@ -27,8 +32,9 @@ class Summarizer:
     
     def __init__(self, header):
         self.bio = io.BytesIO()
-        self.writer = pd.ExcelWriter(self.bio, engine='xlsxwriter')
-        self.workbook = self.writer.book
+        # flush every finished row instead of keeping the whole workbook in memory, rows have to be written in order
+        # dates formatted as `pd.ExcelWriter` does
+        self.workbook = xlsxwriter.Workbook(self.bio, {'constant_memory': True, 'default_date_format': 'YYYY-MM-DD HH:MM:SS'})
         self.header = base64.urlsafe_b64decode(self.HEADER_B64).decode("utf8")
         self.header_table = {
             **header,
@@ -45,10 +51,20 @@ class Summarizer:
         self.format_bottom_left = self.workbook.add_format({'bottom': self.BOLD_LINE_WIDTH, 'left': self.BOLD_LINE_WIDTH})
         self.format_bottom_right = self.workbook.add_format({'bottom': self.BOLD_LINE_WIDTH, 'right': self.BOLD_LINE_WIDTH})
 
+        # boxed header table, formats per row of the table
+        header_len = len(self.header_table)
+        self.header_formats_left = [self.format_top_left] + [self.format_left] * (header_len - 2) + [self.format_bottom_left]
+        self.header_formats_right = [self.format_top_right] + [self.format_right] * (header_len - 2) + [self.format_bottom_right]
+
         self.write_inputs(pd.DataFrame([header]), "Hlavička")
 
     def write_inputs(self, df, name):
-        df.to_excel(self.writer, sheet_name=name, index=False)
+        # `df.to_excel` writes column by column, which the constant memory mode does not support
+        worksheet = self.workbook.add_worksheet(name)
+        # plain header on purpose, `to_excel` made it bold and bordered before pandas 3
+        worksheet.write_row(0, 0, [str(c) for c in df.columns])
+        for row_i, row in enumerate(df.astype(object).where(df.notna(), None).to_numpy().tolist(), start=1):
+            worksheet.write_row(row_i, 0, row)
 
     def write_inventory(self, elements_df):
         # TODO rewrite to elements, implement addition of same elements and sorting of elements
@@ -61,26 +77,26 @@ class Summarizer:
             worksheet.write(row_i, column_i, self.COLUMN_NAMES[column_name], self.format_bold)
         row_i += 1
 
-        for system, system_df in (
-            elements_df
-            .groupby(["system", "position", "name", "spec", "unit", "pn"], dropna=False)
-            .agg(dict(quantity=sum, price=sum))
+        grouped = elements_df.groupby(["system", "position", "name", "spec", "unit", "pn"], dropna=False)[["quantity", "price"]]
+        inventory_df = (
+            grouped.sum()
+            # a missing value leaves the whole total unknown
+            .where(grouped.count().eq(grouped.size(), axis=0))
             .reset_index()
-            .sort_values("position", key=lambda col: col.apply(natural_keys))
-            .groupby("system")
-        ):
+            # positions repeat across elements, split each distinct one once
+            .sort_values("position", key=lambda col: col.map({p: natural_keys(p) for p in col.unique()}))
+        )
+        # derive and round the numbers for all systems at once
+        inventory_df["unit_price"] = (inventory_df.price / inventory_df.quantity).round(decimals=2)
+        inventory_df[["quantity", "price"]] = inventory_df[["quantity", "price"]].round(decimals=2)
+
+        for system, system_df in inventory_df.groupby("system"):
             row_i += 1
             for c_i, _ in enumerate(inventory_order):
                 worksheet.write(row_i, c_i, system if c_i == 1 else "", self.format_bold)
             row_i += 1
-            system_df = system_df.copy()
-            system_df['unit_price'] = system_df.price / system_df.quantity
-            system_df["quantity"] = system_df.quantity.round(decimals=2)
-            system_df["price"] = system_df.price.round(decimals=2)
-            system_df["unit_price"] = system_df.unit_price.round(decimals=2)
-            for _, row in system_df[inventory_order].rename(columns=self.COLUMN_NAMES).iterrows():
-                for col_i, v in enumerate(row.fillna("").values):
-                    worksheet.write(row_i, col_i, v, self.format_fine)
+            for row in system_df[inventory_order].fillna("").to_numpy(dtype=object).tolist():
+                worksheet.write_row(row_i, 0, row, self.format_fine)
                 row_i += 1
 
         worksheet.set_column(0, 0, 8, None)
@@ -101,23 +117,28 @@ class Summarizer:
             worksheet.write(row_i, column_i, self.COLUMN_NAMES[column_name], self.format_bold)
         row_i += 1
         
-        for name, name_df in (
+        shopping_df = (
             elements_df
             .groupby(["name", "spec", "pn", "unit"], dropna=False)
-            .quantity.sum().to_frame()
-            .sort_index(key=lambda x: x.str.normalize("NFKD").str.lower())
+            .quantity.sum()
             .reset_index()
-            .groupby("name")
-        ):
-            name_df = name_df.copy()
-            name_df["quantity"] = name_df.quantity.round(decimals=1)
-            for row_i_, (_, row) in enumerate(name_df[shopping_order].rename(columns=self.COLUMN_NAMES).iterrows()):
-                for col_i, v in enumerate(row.fillna("").values):
-                    if col_i == 0:
-                        worksheet.write(row_i, col_i, name if row_i_ == 0 else "", self.format_fine if row_i_ == len(name_df) - 1 else None)
-                    else:
-                        worksheet.write(row_i, col_i, v, self.format_fine)
-                row_i += 1
+        )
+        # elements without a name are left out, as `groupby("name")` did
+        shopping_df = shopping_df[shopping_df["name"].notna()]
+        # rows of a name group are ordered ignoring case and accents, the keys are normalized once
+        sort_keys = {f"_{c}_key": shopping_df[c].str.normalize("NFKD").str.lower() for c in ["spec", "pn", "unit"]}
+        shopping_df = shopping_df.assign(**sort_keys).sort_values(["name", *sort_keys], kind="stable")
+        shopping_df["quantity"] = shopping_df.quantity.round(decimals=1)
+
+        # the name is shown once per group, the group is underlined, groups are contiguous runs of the same name
+        codes, _ = pd.factorize(shopping_df["name"])
+        group_first = np.r_[True, codes[1:] != codes[:-1]]
+        group_last = np.r_[group_first[1:], True]
+        rows = shopping_df[shopping_order].fillna("").to_numpy(dtype=object).tolist()
+        for row, first, last in zip(rows, group_first.tolist(), group_last.tolist()):
+            worksheet.write(row_i, 0, row[0] if first else "", self.format_fine if last else None)
+            worksheet.write_row(row_i, 1, row[1:], self.format_fine)
+            row_i += 1
 
         worksheet.set_column(0, 0, 35, None)
         worksheet.set_column(1, 1, 40, None)
@@ -128,7 +149,7 @@ class Summarizer:
         worksheet.fit_to_pages(1, 0)
 
     def close(self):
-        self.writer.close()
+        self.workbook.close()
         return self.bio.getvalue()
 
     def _get_worksheet(self, name, header_offset):
@@ -138,16 +159,9 @@ class Summarizer:
         worksheet.hide_gridlines(2)
     
         row_i = 1
-        header_len = len(self.header_table)
         for h_i, (k, v) in enumerate(self.header_table.items()):
-            worksheet.write(
-                row_i, header_offset, k,
-                {0: self.format_top_left, header_len - 1: self.format_bottom_left}.get(h_i, self.format_left),
-            )
-            worksheet.write(
-                row_i, header_offset + 1, v,
-                {0: self.format_top_right, header_len - 1: self.format_bottom_right}.get(h_i, self.format_right),
-            )
+            worksheet.write(row_i, header_offset, k, self.header_formats_left[h_i])
+            worksheet.write(row_i, header_offset + 1, v, self.header_formats_right[h_i])
             row_i += 1
         row_i += 1
         